@@ -1,7 +1,9 @@
 import argparse
 import logging
 
-from news_scraper_bot import NewsScraperBot
+import trio
+
+from news_scraper_bot import NewsScraperBot, scrape_concurrently
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,8 +16,9 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='News Scraper Bot')
     parser.add_argument(
         '--search_phrase',
-        default='default search',
-        help='Search phrase for news articles',
+        nargs='+',
+        default=['default search'],
+        help='Search phrases for news articles, scraped concurrently',
     )
     parser.add_argument(
         '--news_category',
@@ -28,18 +31,27 @@ def parse_arguments():
         default=1,
         help='Number of months of news to scrape',
     )
+    parser.add_argument(
+        '--append',
+        action='store_true',
+        help='Append new articles to the existing output workbook',
+    )
     return parser.parse_args()
 
 
 def main():
     try:
         args = parse_arguments()
-        bot = NewsScraperBot(
-            args.search_phrase,
-            args.news_category,
-            args.num_months,
-        )
-        bot.run()
+        bots = [
+            NewsScraperBot(
+                search_phrase,
+                args.news_category,
+                args.num_months,
+                args.append,
+            )
+            for search_phrase in args.search_phrase
+        ]
+        trio.run(scrape_concurrently, bots)
     except Exception as e:
         logger.error(f'An error occurred: {str(e)}')
 
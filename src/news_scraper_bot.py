@@ -1,7 +1,9 @@
+import json
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 import trio
@@ -27,6 +29,17 @@ log.setup_log(
 )
 
 
+EXCEL_HEADER = [
+    'Title',
+    'Date',
+    'Description',
+    'Image Filename',
+    'Search Phrase',
+    'Count Phrases',
+    'Contains Money',
+]
+
+
 class WebScraper:
     """
     A class for web scraping operations on news websites.
@@ -148,6 +161,7 @@ class WebScraper:
                     'date': article_date,
                     'image_filename': image_filename,
                     'image_url': image_url,
+                    'search_phrase': search_phrase,
                     'count_phrases': count_phrases,
                     'contains_money': contains_money,
                 })
@@ -161,6 +175,81 @@ class WebScraper:
         return articles_data
 
 
+class AsyncWebScraper:
+    """
+    An async interface over WebScraper for use inside a trio event loop.
+
+    Every blocking WebDriver call runs in a worker thread, so several
+    browser sessions can be driven concurrently with the image downloads.
+    """
+
+    def __init__(self, web_scraper: WebScraper):
+        """
+        Initialize the AsyncWebScraper with a WebScraper session.
+
+        Args:
+            web_scraper (WebScraper): The scraper owning the browser session.
+        """
+        self.web_scraper = web_scraper
+        self._lock = trio.Lock()
+
+    async def _run_sync(self, function: Callable, *args) -> Any:
+        """
+        Run a blocking WebScraper call in a worker thread.
+
+        Calls are serialized per session because a WebDriver session does
+        not support concurrent commands.
+
+        Args:
+            function (Callable): The blocking function to call.
+            *args: Positional arguments for the function.
+
+        Returns:
+            Any: The value returned by the function.
+        """
+        async with self._lock:
+            return await trio.to_thread.run_sync(function, *args)
+
+    async def open_website(self) -> None:
+        """
+        Open the news website in a browser without blocking the event loop.
+        """
+        await self._run_sync(self.web_scraper.open_website)
+
+    async def search_news(self, search_phrase: str) -> None:
+        """
+        Perform a search on the news website without blocking the event loop.
+
+        Args:
+            search_phrase (str): The phrase to search for in news articles.
+        """
+        await self._run_sync(self.web_scraper.search_news, search_phrase)
+
+    async def extract_articles_info(
+        self, search_phrase: str, num_months: int
+    ) -> Optional[List[Dict]]:
+        """
+        Extract article information without blocking the event loop.
+
+        Args:
+            search_phrase (str): The phrase used to search for articles.
+            num_months (int): The number of months to look back for articles.
+
+        Returns:
+            Optional[List[Dict]]: A list of dictionaries containing article
+            information, or None if no articles are found.
+        """
+        return await self._run_sync(
+            self.web_scraper.extract_articles_info, search_phrase, num_months
+        )
+
+    async def close(self) -> None:
+        """
+        Close the browser session without blocking the event loop.
+        """
+        await self._run_sync(self.web_scraper.browser.close_all_browsers)
+
+
 class DataProcessor:
     """
     A class for processing and analyzing article data.
@@ -251,45 +340,224 @@ class FileOperations:
         self.output_dir = output_dir
         self.excel = Files()
 
-    def save_to_excel(self, data: List[Dict]) -> None:
+    def save_to_excel(self, data: List[Dict], append: bool = False) -> None:
         """
         Save the scraped article data to an Excel file (.xlsx).
 
+        In append mode the existing workbook is kept and only articles whose
+        key is not yet in the sidecar key index are appended, ordered by date.
+        Otherwise the workbook is recreated and the key index is discarded.
+
         Args:
             data (List[Dict]): A list of dictionaries containing article info.
+            append (bool): Append new articles to an existing workbook
+            instead of recreating it.
         """
         file_path = os.path.join(self.output_dir, 'news_articles.xlsx')
+        if append:
+            self._append_to_excel(file_path, data)
+            return
+
         log.info(f'Saving results to {file_path}')
 
+        self._remove_key_index(self._index_path(file_path))
         self.excel.create_workbook(file_path)
-        self.excel.append_rows_to_worksheet([
-            [
-                'Title',
-                'Date',
-                'Description',
-                'Image Filename',
-                'Count Phrases',
-                'Contains Money',
-            ]
-        ])
+        self.excel.append_rows_to_worksheet([EXCEL_HEADER])
 
         for article in data:
             self.excel.append_rows_to_worksheet(
-                [
-                    [
-                        article['title'],
-                        article['date'],
-                        article['description'],
-                        article['image_filename'],
-                        article['count_phrases'],
-                        article['contains_money'],
-                    ]
-                ],
+                [self._article_row(article)],
                 header=False,
             )
         self.excel.save_workbook()
         log.info('Results saved successfully')
 
+    def _append_to_excel(self, file_path: str, data: List[Dict]) -> None:
+        """
+        Append articles not seen in previous runs to the Excel file.
+
+        Deduplication uses the keys from a small JSON sidecar, so existing
+        rows are only read back when the sidecar is missing or when new
+        articles are older than the last written row and the rows must be
+        reordered. An xlsx file cannot be appended in place, so the whole
+        workbook is still loaded and saved whenever new rows are written.
+        The sidecar is removed while the workbook is written, so a failed
+        run makes the next one rebuild it from the workbook.
+
+        Args:
+            file_path (str): The path of the Excel file.
+            data (List[Dict]): A list of dictionaries containing article info.
+        """
+        index_path = self._index_path(file_path)
+        workbook_exists = os.path.exists(file_path)
+        log.info(f'Appending results to {file_path}')
+
+        if workbook_exists:
+            key_index = self._load_key_index(index_path)
+        else:
+            key_index = None
+            self._remove_key_index(index_path)
+        rebuilt = key_index is None and workbook_exists
+        if key_index is None:
+            key_index = {'keys': set(), 'last_date': ''}
+            if workbook_exists:
+                log.info('Key index not found, rebuilding it from workbook')
+                for row in self._read_excel_rows(file_path):
+                    key_index['keys'].add(self._row_key(row))
+                    key_index['last_date'] = max(
+                        key_index['last_date'], str(row[1])
+                    )
+
+        new_rows = []
+        for article in data:
+            row = self._article_row(article)
+            key = self._row_key(row)
+            if key not in key_index['keys']:
+                key_index['keys'].add(key)
+                new_rows.append(row)
+
+        if not new_rows:
+            if rebuilt:
+                self._save_key_index(index_path, key_index)
+            log.info('No new articles to append')
+            return
+
+        new_rows.sort(key=lambda row: row[1])
+        self._remove_key_index(index_path)
+        if not workbook_exists:
+            self.excel.create_workbook(file_path)
+            self.excel.append_rows_to_worksheet([EXCEL_HEADER])
+            self.excel.append_rows_to_worksheet(new_rows, header=False)
+        elif new_rows[0][1] < key_index['last_date']:
+            log.info('Older articles found, rewriting workbook in date order')
+            rows = self._read_excel_rows(file_path) + new_rows
+            rows.sort(key=lambda row: str(row[1]))
+            self.excel.create_workbook(file_path)
+            self.excel.append_rows_to_worksheet([EXCEL_HEADER])
+            self.excel.append_rows_to_worksheet(rows, header=False)
+        else:
+            self.excel.open_workbook(file_path)
+            self.excel.append_rows_to_worksheet(new_rows, header=False)
+        self.excel.save_workbook()
+
+        key_index['last_date'] = max(key_index['last_date'], new_rows[-1][1])
+        self._save_key_index(index_path, key_index)
+        log.info(f'Appended {len(new_rows)} new articles successfully')
+
+    def _read_excel_rows(self, file_path: str) -> List[List]:
+        """
+        Read all data rows of an existing Excel file.
+
+        Args:
+            file_path (str): The path of the Excel file.
+
+        Returns:
+            List[List]: The rows below the header, in column order.
+        """
+        self.excel.open_workbook(file_path)
+        rows = self.excel.read_worksheet(header=True)
+        self.excel.close_workbook()
+        return [[row[column] for column in EXCEL_HEADER] for row in rows]
+
+    @staticmethod
+    def _article_row(article: Dict) -> List:
+        """
+        Build an Excel row from an article.
+
+        Args:
+            article (Dict): A dictionary containing article info.
+
+        Returns:
+            List: The article values in column order.
+        """
+        return [
+            article['title'],
+            article['date'],
+            article['description'],
+            article['image_filename'],
+            article['search_phrase'],
+            article['count_phrases'],
+            article['contains_money'],
+        ]
+
+    @staticmethod
+    def _row_key(row: List) -> str:
+        """
+        Build the deduplication key of an Excel row.
+
+        Args:
+            row (List): The article values in column order.
+
+        Returns:
+            str: The key made of the article date, title and search phrase.
+        """
+        return f'{row[1]}|{row[0]}|{row[4]}'
+
+    @staticmethod
+    def _index_path(file_path: str) -> str:
+        """
+        Build the path of the key index sidecar of an Excel file.
+
+        Args:
+            file_path (str): The path of the Excel file.
+
+        Returns:
+            str: The path of the key index file.
+        """
+        return os.path.splitext(file_path)[0] + '.keys.json'
+
+    @staticmethod
+    def _remove_key_index(index_path: str) -> None:
+        """
+        Remove the key index sidecar file if it exists.
+
+        Args:
+            index_path (str): The path of the key index file.
+        """
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    @staticmethod
+    def _load_key_index(index_path: str) -> Optional[Dict]:
+        """
+        Load the key index sidecar file.
+
+        Args:
+            index_path (str): The path of the key index file.
+
+        Returns:
+            Optional[Dict]: The known article keys and the last written date,
+            or None if the index does not exist.
+        """
+        if not os.path.exists(index_path):
+            return None
+        with open(index_path, encoding='utf-8') as f:
+            content = json.load(f)
+        return {
+            'keys': set(content['keys']),
+            'last_date': content['last_date'],
+        }
+
+    @staticmethod
+    def _save_key_index(index_path: str, key_index: Dict) -> None:
+        """
+        Save the key index sidecar file atomically.
+
+        Args:
+            index_path (str): The path of the key index file.
+            key_index (Dict): The known article keys and the last written date.
+        """
+        temp_path = f'{index_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'keys': sorted(key_index['keys']),
+                    'last_date': key_index['last_date'],
+                },
+                f,
+            )
+        os.replace(temp_path, index_path)
+
     async def download_images(self, article_data: List[Dict]) -> None:
         """
         Download images for all articles asynchronously.
@@ -355,6 +623,7 @@ class NewsScraperBot:
         search_phrase: Optional[str] = None,
         news_category: Optional[str] = None,
         num_months: Optional[int] = None,
+        append_output: bool = False,
     ):
         """
         Initialize the NewsScraperBot with search parameters.
@@ -363,6 +632,8 @@ class NewsScraperBot:
             search_phrase (str): The phrase to search for in news articles.
             news_category (str): The category of news to focus on.
             num_months (int): The number of months to look back for articles.
+            append_output (bool): Append new articles to the existing output
+            workbook instead of recreating it.
         """
         log.info(
             f'Initializing NewsScraperBot with search phrase: '
@@ -377,12 +648,14 @@ class NewsScraperBot:
             self.search_phrase = work_item.payload.get('search_phrase', '')
             self.news_category = work_item.payload.get('news_category', '')
             self.num_months = work_item.payload.get('num_months', '')
+            self.append_output = work_item.payload.get('append_output', False)
         else:
             # CLI Arguments
             log.info('Executing with CLI arguments')
             self.search_phrase = search_phrase
             self.news_category = news_category
             self.num_months = num_months
+            self.append_output = append_output
 
         log.info(
             f'Search phrase: {self.search_phrase}, '
@@ -399,32 +672,86 @@ class NewsScraperBot:
         """
         Execute the main scraping process.
 
-        Orchestrates the opening of the website, searching for news,
-        and scraping the results.
+        Runs the search of this bot through scrape_concurrently, which
+        scrapes the results, downloads the images and saves the data.
         """
-        try:
-            self.web_scraper.open_website()
-            self.web_scraper.search_news(self.search_phrase)
-            self.scrape_news()
-        finally:
-            self.web_scraper.browser.close_all_browsers()
+        trio.run(scrape_concurrently, [self])
 
-    def scrape_news(self) -> None:
+    async def scrape_news_async(self) -> Optional[List[Dict]]:
         """
-        Scrape news articles and process the results.
+        Scrape news articles and download their images inside trio.
 
-        This method extracts article information, downloads images,
-        and saves the data to an Excel file.
+        The browser session is driven from worker threads, so several bots
+        can scrape concurrently from the same event loop.
+
+        Returns:
+            Optional[List[Dict]]: A list of dictionaries containing article
+            information, or None if no articles are found.
         """
-        log.info('Scraping news...')
-        article_data = self.web_scraper.extract_articles_info(
-            self.search_phrase, self.num_months
+        scraper = AsyncWebScraper(self.web_scraper)
+        try:
+            await scraper.open_website()
+            await scraper.search_news(self.search_phrase)
+            log.info(f'Scraping news for {self.search_phrase}...')
+            article_data = await scraper.extract_articles_info(
+                self.search_phrase, self.num_months
+            )
+            if article_data:
+                await self.file_operations.download_images(article_data)
+            return article_data
+        finally:
+            with trio.CancelScope(shield=True):
+                await scraper.close()
+
+
+async def scrape_concurrently(bots: List[NewsScraperBot]) -> None:
+    """
+    Run several searches concurrently in one process and save the results.
+
+    Each bot drives its own browser session from the same event loop. A
+    search that fails is logged and skipped, and the results of the other
+    searches are saved once, in date order, to the output workbook of the
+    first bot.
+
+    Args:
+        bots (List[NewsScraperBot]): The bots to run, one per search.
+
+    Raises:
+        RuntimeError: If every search failed.
+    """
+    results: List[Optional[List[Dict]]] = [None] * len(bots)
+    errors: List[Exception] = []
+
+    async def scrape(index: int, bot: NewsScraperBot) -> None:
+        try:
+            results[index] = await bot.scrape_news_async()
+        except Exception as e:
+            errors.append(e)
+            log.exception(
+                f'Error scraping news for {bot.search_phrase}: {str(e)}'
+            )
+
+    async with trio.open_nursery() as nursery:
+        for index, bot in enumerate(bots):
+            nursery.start_soon(scrape, index, bot)
+
+    if errors and len(errors) == len(bots):
+        raise RuntimeError(f'All {len(bots)} searches failed') from errors[0]
+
+    article_data = sorted(
+        (article for articles in results if articles for article in articles),
+        key=lambda article: article['date'],
+    )
+    if article_data:
+        await trio.to_thread.run_sync(
+            partial(
+                bots[0].file_operations.save_to_excel,
+                article_data,
+                append=any(bot.append_output for bot in bots),
+            )
         )
-        if article_data:
-            trio.run(self.file_operations.download_images, article_data)
-            self.file_operations.save_to_excel(article_data)
-        else:
-            log.info('No articles found within the date range')
+    else:
+        log.info('No articles found within the date range')
 
 
 def main():
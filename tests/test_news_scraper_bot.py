@@ -1,13 +1,19 @@
 import datetime
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import trio
+from openpyxl import load_workbook
 
 from src.news_scraper_bot import (
+    EXCEL_HEADER,
+    AsyncWebScraper,
     DataProcessor,
     FileOperations,
     NewsScraperBot,
     WebScraper,
+    scrape_concurrently,
 )
 
 
@@ -21,6 +27,19 @@ def file_operations():
     return FileOperations('test_output')
 
 
+@pytest.fixture
+def article():
+    return {
+        'title': 'First',
+        'date': '2023-01-01',
+        'description': 'First desc',
+        'image_filename': 'first.jpg',
+        'search_phrase': 'test',
+        'count_phrases': 1,
+        'contains_money': False,
+    }
+
+
 @patch('src.news_scraper_bot.Selenium')
 def test_web_scraper_init(mock_selenium):
     """
@@ -48,6 +67,27 @@ def test_open_website(mock_selenium):
     )
 
 
+@pytest.mark.trio
+async def test_async_web_scraper():
+    """
+    Test the AsyncWebScraper delegating to the WebScraper session.
+    """
+    web_scraper = MagicMock()
+    web_scraper.extract_articles_info.return_value = [{'title': 'Test'}]
+    scraper = AsyncWebScraper(web_scraper)
+
+    await scraper.open_website()
+    await scraper.search_news('test')
+    articles = await scraper.extract_articles_info('test', 1)
+    await scraper.close()
+
+    assert articles == [{'title': 'Test'}]
+    web_scraper.open_website.assert_called_once()
+    web_scraper.search_news.assert_called_once_with('test')
+    web_scraper.extract_articles_info.assert_called_once_with('test', 1)
+    web_scraper.browser.close_all_browsers.assert_called_once()
+
+
 def test_is_article_within_date_range():
     """
     Test if an article is within the specified date range.
@@ -113,6 +153,7 @@ def test_save_to_excel(mock_files_class):
             'date': '2023-01-01',
             'description': 'Test desc',
             'image_filename': 'test.jpg',
+            'search_phrase': 'test',
             'count_phrases': 1,
             'contains_money': False,
         }
@@ -122,6 +163,182 @@ def test_save_to_excel(mock_files_class):
     mock_files_instance.create_workbook.assert_called_once()
 
 
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_append_skips_duplicates(
+    mock_files_class, tmp_path, article
+):
+    """
+    Test appending only unseen articles to an existing Excel file.
+    """
+    mock_files_instance = mock_files_class.return_value
+    file_operations = FileOperations(str(tmp_path))
+
+    first = article
+    second = {**first, 'title': 'Second', 'date': '2023-01-02'}
+
+    file_operations.save_to_excel([first], append=True)
+    mock_files_instance.create_workbook.assert_called_once()
+    assert (tmp_path / 'news_articles.keys.json').exists()
+
+    (tmp_path / 'news_articles.xlsx').touch()
+    mock_files_instance.reset_mock()
+    file_operations.save_to_excel([second, first], append=True)
+
+    mock_files_instance.create_workbook.assert_not_called()
+    mock_files_instance.read_worksheet.assert_not_called()
+    mock_files_instance.open_workbook.assert_called_once()
+    mock_files_instance.append_rows_to_worksheet.assert_called_once_with(
+        [FileOperations._article_row(second)], header=False
+    )
+
+
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_append_keeps_date_order(
+    mock_files_class, tmp_path, article
+):
+    """
+    Test rewriting the Excel file when older articles are appended.
+    """
+    mock_files_instance = mock_files_class.return_value
+    file_operations = FileOperations(str(tmp_path))
+
+    newer = {**article, 'title': 'Newer', 'date': '2023-02-01'}
+    older = {**article, 'title': 'Older'}
+
+    file_operations.save_to_excel([newer], append=True)
+    (tmp_path / 'news_articles.xlsx').touch()
+    mock_files_instance.reset_mock()
+    mock_files_instance.read_worksheet.return_value = [
+        dict(zip(EXCEL_HEADER, FileOperations._article_row(newer)))
+    ]
+    file_operations.save_to_excel([older], append=True)
+
+    mock_files_instance.create_workbook.assert_called_once()
+    mock_files_instance.append_rows_to_worksheet.assert_called_with(
+        [
+            FileOperations._article_row(older),
+            FileOperations._article_row(newer),
+        ],
+        header=False,
+    )
+
+
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_append_rebuilds_key_index(
+    mock_files_class, tmp_path, article
+):
+    """
+    Test rebuilding a missing key index from the existing Excel file.
+    """
+    mock_files_instance = mock_files_class.return_value
+    file_operations = FileOperations(str(tmp_path))
+
+    first = article
+    second = {**first, 'title': 'Second', 'date': '2023-01-02'}
+
+    (tmp_path / 'news_articles.xlsx').touch()
+    mock_files_instance.read_worksheet.return_value = [
+        dict(zip(EXCEL_HEADER, FileOperations._article_row(first)))
+    ]
+    file_operations.save_to_excel([first, second], append=True)
+
+    mock_files_instance.read_worksheet.assert_called_once()
+    mock_files_instance.create_workbook.assert_not_called()
+    mock_files_instance.append_rows_to_worksheet.assert_called_once_with(
+        [FileOperations._article_row(second)], header=False
+    )
+    key_index = json.loads((tmp_path / 'news_articles.keys.json').read_text())
+    assert key_index == {
+        'keys': ['2023-01-01|First|test', '2023-01-02|Second|test'],
+        'last_date': '2023-01-02',
+    }
+
+
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_append_saves_rebuilt_key_index(
+    mock_files_class, tmp_path, article
+):
+    """
+    Test saving a rebuilt key index even when no articles are new.
+    """
+    mock_files_instance = mock_files_class.return_value
+    file_operations = FileOperations(str(tmp_path))
+
+    (tmp_path / 'news_articles.xlsx').touch()
+    mock_files_instance.read_worksheet.return_value = [
+        dict(zip(EXCEL_HEADER, FileOperations._article_row(article)))
+    ]
+    file_operations.save_to_excel([article], append=True)
+
+    mock_files_instance.save_workbook.assert_not_called()
+    key_index = json.loads((tmp_path / 'news_articles.keys.json').read_text())
+    assert key_index == {
+        'keys': ['2023-01-01|First|test'],
+        'last_date': '2023-01-01',
+    }
+
+
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_append_ignores_stale_key_index(
+    mock_files_class, tmp_path, article
+):
+    """
+    Test recreating the Excel file when only the key index is left.
+    """
+    mock_files_instance = mock_files_class.return_value
+    file_operations = FileOperations(str(tmp_path))
+
+    file_operations.save_to_excel([article], append=True)
+    assert (tmp_path / 'news_articles.keys.json').exists()
+    mock_files_instance.reset_mock()
+    file_operations.save_to_excel([article], append=True)
+
+    mock_files_instance.create_workbook.assert_called_once()
+    mock_files_instance.append_rows_to_worksheet.assert_called_with(
+        [FileOperations._article_row(article)], header=False
+    )
+
+
+@patch('src.news_scraper_bot.Files')
+def test_save_to_excel_removes_key_index(mock_files_class, tmp_path):
+    """
+    Test discarding the key index when the Excel file is recreated.
+    """
+    file_operations = FileOperations(str(tmp_path))
+    index_path = tmp_path / 'news_articles.keys.json'
+    index_path.write_text('{"keys": ["2023-01-01|First"], "last_date": ""}')
+
+    file_operations.save_to_excel([])
+
+    assert not index_path.exists()
+
+
+def test_save_to_excel_append_round_trip(tmp_path, article):
+    """
+    Test appending to a real Excel file keeps date order without duplicates.
+    """
+    file_operations = FileOperations(str(tmp_path))
+
+    first = {**article, 'date': '2023-01-02'}
+    second = {**first, 'title': 'Second', 'date': '2023-01-03'}
+    older = {**article, 'title': 'Older', 'date': '2023-01-01'}
+    other = {**first, 'search_phrase': 'other', 'count_phrases': 2}
+
+    file_operations.save_to_excel([first], append=True)
+    file_operations.save_to_excel([second, first], append=True)
+    file_operations.save_to_excel([older, second, other], append=True)
+
+    workbook = load_workbook(tmp_path / 'news_articles.xlsx')
+    rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    assert rows == [
+        EXCEL_HEADER,
+        FileOperations._article_row(older),
+        FileOperations._article_row(first),
+        FileOperations._article_row(other),
+        FileOperations._article_row(second),
+    ]
+
+
 @pytest.mark.trio
 async def test_download_images(file_operations):
     """
@@ -159,6 +376,9 @@ def test_news_scraper_bot_run(mock_web_scraper):
 
     bot = NewsScraperBot('test', 'news', 1)
     bot.web_scraper = mock_web_scraper.return_value
+    bot.web_scraper.extract_articles_info.return_value = [
+        {'title': 'Test', 'date': '2023-01-01'}
+    ]
     bot.file_operations = mock_file_ops
 
     bot.run()
@@ -168,3 +388,127 @@ def test_news_scraper_bot_run(mock_web_scraper):
     mock_web_scraper.return_value.extract_articles_info.assert_called_once()
     mock_file_ops.download_images.assert_called_once()
     mock_file_ops.save_to_excel.assert_called_once()
+
+
+@pytest.mark.trio
+@patch('src.news_scraper_bot.WebScraper')
+async def test_scrape_concurrently(mock_web_scraper):
+    """
+    Test running several searches concurrently and saving once.
+    """
+    mock_file_ops = MagicMock()
+    mock_file_ops.download_images = AsyncMock()
+
+    bots = [
+        NewsScraperBot('first', 'news', 1),
+        NewsScraperBot('second', 'news', 1, append_output=True),
+    ]
+    for bot in bots:
+        bot.web_scraper = MagicMock()
+        bot.file_operations = mock_file_ops
+    bots[0].web_scraper.extract_articles_info.return_value = [
+        {'title': 'first', 'date': '2023-01-02'}
+    ]
+    bots[1].web_scraper.extract_articles_info.return_value = [
+        {'title': 'second', 'date': '2023-01-01'}
+    ]
+
+    await scrape_concurrently(bots)
+
+    for bot in bots:
+        bot.web_scraper.search_news.assert_called_once_with(bot.search_phrase)
+        bot.web_scraper.browser.close_all_browsers.assert_called_once()
+    assert mock_file_ops.download_images.call_count == len(bots)
+    mock_file_ops.save_to_excel.assert_called_once_with(
+        [
+            {'title': 'second', 'date': '2023-01-01'},
+            {'title': 'first', 'date': '2023-01-02'},
+        ],
+        append=True,
+    )
+
+
+@pytest.mark.trio
+@patch('src.news_scraper_bot.WebScraper')
+async def test_scrape_concurrently_isolates_failures(mock_web_scraper):
+    """
+    Test that a failing search does not discard the other results.
+    """
+    mock_file_ops = MagicMock()
+    mock_file_ops.download_images = AsyncMock()
+
+    bots = [
+        NewsScraperBot('first', 'news', 1),
+        NewsScraperBot('second', 'news', 1),
+    ]
+    for bot in bots:
+        bot.web_scraper = MagicMock()
+        bot.file_operations = mock_file_ops
+    bots[0].web_scraper.extract_articles_info.side_effect = ValueError
+    bots[1].web_scraper.extract_articles_info.return_value = [
+        {'title': 'second', 'date': '2023-01-01'}
+    ]
+
+    await scrape_concurrently(bots)
+
+    for bot in bots:
+        bot.web_scraper.browser.close_all_browsers.assert_called_once()
+    mock_file_ops.save_to_excel.assert_called_once_with(
+        [{'title': 'second', 'date': '2023-01-01'}], append=False
+    )
+
+
+@pytest.mark.trio
+@patch('src.news_scraper_bot.WebScraper')
+async def test_scrape_concurrently_raises_when_all_fail(mock_web_scraper):
+    """
+    Test that a run where every search failed is reported as an error.
+    """
+    mock_file_ops = MagicMock()
+
+    bots = [
+        NewsScraperBot('first', 'news', 1),
+        NewsScraperBot('second', 'news', 1),
+    ]
+    for bot in bots:
+        bot.web_scraper = MagicMock()
+        bot.web_scraper.extract_articles_info.side_effect = ValueError
+        bot.file_operations = mock_file_ops
+
+    with pytest.raises(RuntimeError, match='All 2 searches failed'):
+        await scrape_concurrently(bots)
+
+    mock_file_ops.save_to_excel.assert_not_called()
+
+
+@pytest.mark.trio
+@patch('src.news_scraper_bot.WebScraper')
+async def test_scrape_news_async_closes_browser_on_cancel(mock_web_scraper):
+    """
+    Test that every browser is closed when sibling searches are cancelled.
+    """
+    bots = [
+        NewsScraperBot('first', 'news', 1),
+        NewsScraperBot('second', 'news', 1),
+    ]
+    for bot in bots:
+        bot.web_scraper = MagicMock()
+        bot.web_scraper.extract_articles_info.return_value = [
+            {'title': bot.search_phrase}
+        ]
+        bot.file_operations = MagicMock()
+        bot.file_operations.download_images = AsyncMock(
+            side_effect=trio.sleep_forever
+        )
+    bots[0].web_scraper.extract_articles_info.side_effect = ValueError
+
+    async def scrape_all() -> None:
+        async with trio.open_nursery(strict_exception_groups=True) as nursery:
+            for bot in bots:
+                nursery.start_soon(bot.scrape_news_async)
+
+    with pytest.raises(ExceptionGroup):
+        await scrape_all()
+
+    for bot in bots:
+        bot.web_scraper.browser.close_all_browsers.assert_called_once()